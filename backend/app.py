@@ -11,90 +11,612 @@ A Flask API that supports:
 import os
 import tempfile
 import subprocess
-import uuid
 import logging
+import logging.handlers
 import shutil
+import mimetypes
+import unicodedata
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, after_this_request
+from urllib.parse import quote
+from flask import Flask, Request, request, jsonify, send_file, after_this_request
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 import threading
 import time
+import socket
+import atexit
+import platform
+import heapq
+import math
+import multiprocessing
+import itertools
+import secrets
+import queue
+import collections
+import hashlib
 from PIL import Image
-import PyPDF2
+import pikepdf
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.utils import ImageReader
+from reportlab import rl_config
 import io
 import zipfile
 
 # Import pdf2docx for reliable PDF to Word conversion
 try:
     from pdf2docx import Converter
+    import fitz
     PDF2DOCX_AVAILABLE = True
     print("✅ pdf2docx library loaded successfully")
 except ImportError:
     PDF2DOCX_AVAILABLE = False
     print("❌ pdf2docx library not available - PDF to Word conversion will not work")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('converter.log'),
-        logging.StreamHandler()
-    ]
-)
+# Import streaming-form-data to write uploads straight to disk
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import FileTarget, ValueTarget
+    STREAMING_FORM_DATA_AVAILABLE = True
+    print("✅ streaming-form-data library loaded successfully")
+except ImportError:
+    STREAMING_FORM_DATA_AVAILABLE = False
+    print("⚠️  streaming-form-data not available - falling back to Werkzeug form parsing")
+
+# Import liburing to batch file deletions through io_uring
+try:
+    import liburing
+    LIBURING_AVAILABLE = True
+    print("✅ liburing library loaded successfully")
+except ImportError:
+    LIBURING_AVAILABLE = False
+    print("⚠️  liburing not available - stale files will be removed one syscall at a time")
+
+# Import inotify_simple so stale files are reaped on events instead of polling
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+    print("✅ inotify_simple library loaded successfully")
+except ImportError:
+    INOTIFY_AVAILABLE = False
+    print("⚠️  inotify_simple not available - stale files will be found by polling")
+
+# Import Celery (and docxcompose for joining page batches) for background conversions
+try:
+    from celery import Celery, chord
+    from celery.signals import worker_process_init
+    from docx import Document
+    from docxcompose.composer import Composer
+    CELERY_AVAILABLE = True
+    print("✅ Celery library loaded successfully")
+except ImportError:
+    CELERY_AVAILABLE = False
+    print("⚠️  Celery not available - conversions can only run inside the request")
+
+# Import python-uno to drive a persistent LibreOffice instance for Word to PDF
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    UNO_AVAILABLE = True
+    print("✅ python-uno loaded successfully")
+except ImportError:
+    UNO_AVAILABLE = False
+    print("⚠️  python-uno not available - Word to PDF will start LibreOffice per request")
+
+# Configure logging. Records are queued and written by a listener thread, so
+# request threads never wait on the log file or stderr
+log_handlers = [
+    logging.FileHandler('converter.log'),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+log_queue_handler = logging.handlers.QueueHandler(queue.Queue())
+log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # the listener's handlers add the rest
+# force: pdf2docx calls basicConfig() on import, which would make this call a no-op
+logging.basicConfig(level=logging.INFO, handlers=[log_queue_handler], force=True)
 logger = logging.getLogger(__name__)
+log_listener = None
+
+def start_log_listener():
+    """Start the thread that writes queued log records. Forked children need their own"""
+    global log_listener
+    # A fresh queue: the parent's listener may have held the old one's lock at fork time
+    log_queue_handler.queue = queue.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue_handler.queue, *log_handlers)
+    log_listener.start()
+
+def stop_log_listener():
+    """Write out any queued log records and stop the listener thread"""
+    log_listener.stop()
+
+start_log_listener()
+os.register_at_fork(after_in_child=start_log_listener)
+atexit.register(stop_log_listener)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend requests
 
 # Configuration
-UPLOAD_FOLDER = tempfile.mkdtemp()
-CONVERTED_FOLDER = tempfile.mkdtemp()
+# Stable parent folder for converted files, so a reverse proxy can serve them directly
+CONVERTED_ROOT = os.environ.get('CONVERTED_ROOT')
+# nginx internal location aliased to CONVERTED_ROOT, e.g. /_protected/ (enables X-Accel-Redirect)
+X_ACCEL_REDIRECT_PREFIX = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
+
+# Without CONVERTED_ROOT the files live in random temp folders that no nginx alias
+# can point at, and every redirected download would be a 404
+if X_ACCEL_REDIRECT_PREFIX and not CONVERTED_ROOT:
+    raise Exception("X_ACCEL_REDIRECT_PREFIX requires CONVERTED_ROOT, the folder its nginx location aliases")
+
+# Keep scratch files in RAM when /dev/shm is a tmpfs mount; otherwise use the default temp dir
+SCRATCH_ROOT = '/dev/shm' if os.path.ismount('/dev/shm') else None
+
+def worker_folder_prefix(pid):
+    """Name prefix of the folders process pid keeps its files in"""
+    return f"converter_{pid}_"
+
+def make_upload_folder():
+    """Create a fresh folder for this process's uploads"""
+    return tempfile.mkdtemp(prefix=worker_folder_prefix(os.getpid()), dir=SCRATCH_ROOT)
+
+def make_converted_folder():
+    """Create a fresh folder for converted files, inside CONVERTED_ROOT when configured"""
+    if not CONVERTED_ROOT:
+        return tempfile.mkdtemp(prefix=worker_folder_prefix(os.getpid()), dir=SCRATCH_ROOT)
+    
+    os.makedirs(CONVERTED_ROOT, exist_ok=True)
+    folder = tempfile.mkdtemp(prefix=worker_folder_prefix(os.getpid()), dir=CONVERTED_ROOT)
+    os.chmod(folder, 0o750)  # the proxy reads files through the app user's group
+    return folder
+
+def remove_worker_folders(pid):
+    """
+    Delete the upload and converted folders of process pid. Its reaper and janitor
+    die with it, so nothing else would ever remove them.
+    """
+    prefix = worker_folder_prefix(pid)
+    for parent in {SCRATCH_ROOT or tempfile.gettempdir(), CONVERTED_ROOT or SCRATCH_ROOT or tempfile.gettempdir()}:
+        try:
+            entries = list(os.scandir(parent))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+# Both folders exist from import time on, under any WSGI server. With deferred
+# services (the gunicorn master, Celery) the processes that serve requests make
+# their own, and importing the app creates none.
+if os.environ.get('CONVERTER_DEFER_SERVICES'):
+    UPLOAD_FOLDER = CONVERTED_FOLDER = None
+else:
+    UPLOAD_FOLDER = make_upload_folder()
+    CONVERTED_FOLDER = make_converted_folder()
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MIN_FREE_SCRATCH_SPACE = MAX_FILE_SIZE * 3  # room for an upload, its output and intermediates
+UPLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from the request stream at a time
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024  # write buffer for Werkzeug-parsed upload parts
+MAX_FORM_MEMORY_SIZE = 500 * 1024  # cap on non-file form fields held in memory
+IMAGE_PDF_DPI = 300  # resolution images are resampled to before embedding
+rl_config.useA85 = 0  # write image streams as binary; ASCII85 adds 25% to every embedded image
+# Bytes of image PDFs kept for repeated uploads of the same images, 0 = no cache
+IMAGE_PDF_CACHE_SIZE = int(os.environ.get('IMAGE_PDF_CACHE_SIZE', 50 * 1024 * 1024))
+IO_URING_BATCH_SIZE = 256  # unlinks submitted per io_uring_enter
+IO_URING_MIN_FILES = 32  # below this, setting up a ring costs more syscalls than os.unlink
+FILE_MAX_AGE = 3600  # seconds before an uploaded/converted file is removed (1 hour)
+# Seconds to keep files after a response; the proxy needs longer to finish its own transfer
+CLEANUP_DELAY = 30 if X_ACCEL_REDIRECT_PREFIX else 3
+PARALLEL_PAGE_THRESHOLD = 4  # pages before pdf2docx converts with multiple processes
+CONVERT_CPU_COUNT = int(os.environ.get('CONVERT_CPU_COUNT', 0))  # per-conversion process cap, 0 = no cap
+PDF2DOCX_POOL_SIZE = int(os.environ.get('PDF2DOCX_POOL_SIZE', 2))  # warm pdf2docx processes, 0 = convert in-process
+PDF2DOCX_POOL_MAX_TASKS = 20  # conversions before a pool process is replaced, bounding memory growth
+PDF2DOCX_POOL_TIMEOUT = 300  # seconds before a pool conversion is given up and the pool replaced
+
+# Background conversion jobs (opt-in with ?async=1)
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+JOB_BATCH_THRESHOLD = 20  # PDFs with more pages are converted in page batches
+JOB_BATCH_PAGES = 10  # pages per batch
 ALLOWED_EXTENSIONS = {
-    'pdf': {'pdf'},
-    'word': {'doc', 'docx'},
-    'image': {'jpg', 'jpeg', 'png'}
+    'pdf': frozenset({'.pdf'}),
+    'word': frozenset({'.doc', '.docx'}),
+    'image': frozenset({'.jpg', '.jpeg', '.png'})
 }
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['CONVERTED_FOLDER'] = CONVERTED_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'  # Apache/lighttpd mod_xsendfile
+
+class ConverterRequest(Request):
+    """
+    Request that spools Werkzeug-parsed file parts straight into UPLOAD_FOLDER, rather than
+    into a SpooledTemporaryFile that would then have to be copied to its final path
+    """
+    max_form_memory_size = MAX_FORM_MEMORY_SIZE
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.NamedTemporaryFile(
+            'wb+', buffering=UPLOAD_COPY_BUFFER_SIZE, dir=app.config['UPLOAD_FOLDER']
+        )
+
+app.request_class = ConverterRequest
+
+# Persistent LibreOffice daemon (one soffice process, conversions over UNO)
+SOFFICE_HOST = 'localhost'
+SOFFICE_PORT = int(os.environ.get('SOFFICE_PORT', 2002))
+SOFFICE_STARTUP_TIMEOUT = 30  # seconds to wait for the UNO socket
+SOFFICE_CONVERSION_TIMEOUT = 300  # seconds a LibreOffice conversion may take before it is killed
+UNO_EXPORT_FILTERS = {
+    'pdf': 'writer_pdf_Export'
+}
+
+LIBREOFFICE_CHECK_TTL = 60  # seconds a LibreOffice availability probe is trusted
+
+soffice_process = None
+soffice_lock = threading.Lock()  # guards starting/restarting the daemon
+uno_lock = threading.Lock()  # a single soffice instance is not reentrant
+libreoffice_status = None  # (monotonic time of last probe, available)
+libreoffice_probe_lock = threading.Lock()  # held by the one thread re-probing LibreOffice
+pdf2docx_parallel_lock = threading.Lock()  # serializes pdf2docx runs that chdir
+pdf2docx_pool = None  # warm worker processes for small conversions, see start_pdf2docx_pool()
+pdf2docx_pool_lock = threading.Lock()  # guards replacing a stuck pool
+cleanup_queue = queue.Queue()  # (due monotonic time, paths) handed to the janitor thread
+cleanup_pending = collections.deque()  # batches the janitor is waiting on, oldest first
+file_id_prefix = None
+file_id_counter = None
+
+def reseed_file_ids():
+    """Draw a fresh random prefix, so forked workers never hand out their parent's IDs"""
+    global file_id_prefix, file_id_counter
+    file_id_prefix = secrets.token_urlsafe(6)
+    file_id_counter = itertools.count()
+
+def new_id():
+    """Unique name for an upload or output file: the process's random prefix plus a counter"""
+    return f"{file_id_prefix}{next(file_id_counter):08x}"
+
+reseed_file_ids()
+os.register_at_fork(after_in_child=reseed_file_ids)
 
 def allowed_file(filename, file_type):
     """Check if the uploaded file has an allowed extension"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS[file_type]
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS[file_type]
+
+if STREAMING_FORM_DATA_AVAILABLE:
+    class CountingFileTarget(FileTarget):
+        """FileTarget that counts the bytes it writes, so saved uploads need no stat"""
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.size = 0
+        
+        def on_data_received(self, chunk):
+            super().on_data_received(chunk)
+            self.size += len(chunk)
+
+def receive_uploads(file_fields, value_fields=()):
+    """
+    Parse the multipart request body, writing each file part directly to UPLOAD_FOLDER.
+    Returns ({field: (saved_path, original_filename, size)}, {field: value}) for the fields present.
+    """
+    if request.mimetype != 'multipart/form-data':
+        return {}, {}
+    
+    if not STREAMING_FORM_DATA_AVAILABLE:
+        files = {}
+        for field in file_fields:
+            if field in request.files:
+                file = request.files[field]
+                file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{new_id()}_{secure_filename(file.filename)}")
+                # The part is already on disk in UPLOAD_FOLDER (see ConverterRequest);
+                # link it to its final name instead of copying it
+                file.stream.flush()
+                os.link(file.stream.name, file_path)
+                files[field] = (file_path, file.filename, os.fstat(file.stream.fileno()).st_size)
+        values = {field: request.form[field] for field in value_fields if field in request.form}
+        return files, values
+    
+    parser = StreamingFormDataParser(headers=request.headers)
+    
+    # Parts are streamed to a placeholder name, renamed once the filename is known
+    file_targets = {}
+    for field in file_fields:
+        unique_id = new_id()
+        target = CountingFileTarget(os.path.join(app.config['UPLOAD_FOLDER'], f"{unique_id}_{field}"), allow_overwrite=True)
+        parser.register(field, target)
+        file_targets[field] = (unique_id, target)
+    
+    value_targets = {}
+    for field in value_fields:
+        target = ValueTarget()
+        parser.register(field, target)
+        value_targets[field] = target
+    
+    try:
+        max_length = app.config['MAX_CONTENT_LENGTH']
+        received = 0
+        
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            received += len(chunk)
+            if max_length is not None and received > max_length:
+                raise RequestEntityTooLarge()
+            
+            parser.data_received(chunk)
+        
+        files = {}
+        for field, (unique_id, target) in file_targets.items():
+            if target.multipart_filename is None:
+                continue
+            
+            file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{unique_id}_{secure_filename(target.multipart_filename)}")
+            os.replace(target.filename, file_path)
+            files[field] = (file_path, target.multipart_filename, target.size)
+        
+    except Exception:
+        for unique_id, target in file_targets.values():
+            Path(target.filename).unlink(missing_ok=True)
+        raise
+    
+    values = {field: target.value.decode('utf-8') for field, target in value_targets.items() if target.value}
+    return files, values
+
+def kernel_supports_io_uring_unlink():
+    """IORING_OP_UNLINKAT is available from Linux 5.11"""
+    if platform.system() != 'Linux':
+        return False
+    try:
+        major, minor = platform.release().split('.')[:2]
+        return (int(major), int(minor.split('-')[0])) >= (5, 11)
+    except ValueError:
+        return False
+
+IO_URING_UNLINK_AVAILABLE = LIBURING_AVAILABLE and kernel_supports_io_uring_unlink()
+
+def unlink_files_io_uring(file_paths):
+    """Unlink files in batches of IO_URING_BATCH_SIZE, one submission per batch"""
+    removed = []
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(IO_URING_BATCH_SIZE, ring)
+    
+    try:
+        for start in range(0, len(file_paths), IO_URING_BATCH_SIZE):
+            batch = file_paths[start:start + IO_URING_BATCH_SIZE]
+            
+            for index, file_path in enumerate(batch):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_unlink(sqe, str(file_path))
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            
+            liburing.io_uring_submit_and_wait(ring, len(batch))
+            liburing.io_uring_wait_cqe_nr(ring, cqe, len(batch))
+            
+            for i in range(len(batch)):
+                entry = cqe[i]
+                file_path = batch[entry.user_data]
+                try:
+                    entry.res  # raises OSError if the unlink failed
+                    removed.append(file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.error(f"Error cleaning up file {file_path}: {e}")
+            
+            liburing.io_uring_cq_advance(ring, len(batch))
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    
+    return removed
+
+def unlink_files(file_paths):
+    """Delete files, batching large sets of unlinks through io_uring when available. Returns removed paths"""
+    if IO_URING_UNLINK_AVAILABLE and len(file_paths) >= IO_URING_MIN_FILES:
+        try:
+            return unlink_files_io_uring(file_paths)
+        except OSError as e:
+            logger.warning(f"io_uring unlink failed, falling back to os.unlink: {e}")
+    
+    removed = []
+    for file_path in file_paths:
+        try:
+            os.unlink(file_path)
+            removed.append(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error cleaning up file {file_path}: {e}")
+    return removed
 
 def cleanup_old_files():
     """Clean up files older than 1 hour"""
+    if INOTIFY_AVAILABLE:
+        reap_old_files_with_inotify()
+    else:
+        sweep_old_files()
+
+def reap_old_files_with_inotify():
+    """Unlink each file FILE_MAX_AGE after it appeared or was written, scheduled from inotify events"""
+    inotify = INotify()
+    watched_folders = {}
+    for folder in (UPLOAD_FOLDER, CONVERTED_FOLDER):
+        # CREATE catches hard-linked uploads (see receive_uploads), which never
+        # see a write; a file that is also written just gets a later, duplicate expiry
+        wd = inotify.add_watch(folder, inotify_flags.CREATE | inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+        watched_folders[wd] = folder
+    
+    # Heap of (expiry time, path), seeded with files that already exist
+    expiries = []
+    for folder in watched_folders.values():
+        for file_path in Path(folder).glob('*'):
+            heapq.heappush(expiries, (file_path.stat().st_mtime + FILE_MAX_AGE, str(file_path)))
+    
+    while True:
+        try:
+            # Sleep until the next expiry or until a file is written
+            timeout = None
+            if expiries:
+                timeout = math.ceil(max(0, expiries[0][0] - time.time()) * 1000)
+            
+            for event in inotify.read(timeout=timeout):
+                if event.wd in watched_folders and event.name:
+                    file_path = os.path.join(watched_folders[event.wd], event.name)
+                    heapq.heappush(expiries, (time.time() + FILE_MAX_AGE, file_path))
+            
+            current_time = time.time()
+            expired_files = []
+            while expiries and expiries[0][0] <= current_time:
+                expired_files.append(heapq.heappop(expiries)[1])
+            
+            if expired_files:
+                for file_path in unlink_files(expired_files):
+                    logger.info(f"Cleaned up old file: {file_path}")
+                    
+        except Exception as e:
+            logger.error(f"Cleanup error: {e}")
+            time.sleep(1)
+
+def sweep_old_files():
+    """Periodically scan both folders for files older than FILE_MAX_AGE"""
     while True:
         try:
             current_time = time.time()
+            stale_files = []
             
-            # Clean upload folder
-            for file_path in Path(UPLOAD_FOLDER).glob('*'):
-                if current_time - file_path.stat().st_mtime > 3600:  # 1 hour
-                    file_path.unlink(missing_ok=True)
-                    logger.info(f"Cleaned up old upload file: {file_path}")
-            
-            # Clean converted folder
-            for file_path in Path(CONVERTED_FOLDER).glob('*'):
-                if current_time - file_path.stat().st_mtime > 3600:  # 1 hour
-                    file_path.unlink(missing_ok=True)
-                    logger.info(f"Cleaned up old converted file: {file_path}")
+            # Collect stale files from the upload and converted folders
+            for folder in (UPLOAD_FOLDER, CONVERTED_FOLDER):
+                for file_path in Path(folder).glob('*'):
+                    if current_time - file_path.stat().st_mtime > FILE_MAX_AGE:
+                        stale_files.append(file_path)
+            
+            for file_path in unlink_files(stale_files):
+                logger.info(f"Cleaned up old file: {file_path}")
                     
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
         
         time.sleep(1800)  # Run every 30 minutes
 
+def start_libreoffice_daemon():
+    """Start (or restart) the headless soffice process that accepts UNO connections"""
+    global soffice_process
+    
+    with soffice_lock:
+        if soffice_process is not None and soffice_process.poll() is None:
+            return soffice_process
+        
+        soffice_binary = shutil.which('soffice') or shutil.which('libreoffice')
+        if not soffice_binary:
+            logger.error("LibreOffice not found - cannot start UNO daemon")
+            return None
+        
+        # Each daemon needs its own profile, otherwise soffice hands the
+        # request over to an already running instance and exits
+        profile_dir = Path(tempfile.gettempdir()) / f"libreoffice_uno_{SOFFICE_PORT}"
+        
+        cmd = [
+            soffice_binary,
+            '--headless',
+            '--invisible',
+            '--nologo',
+            '--nodefault',
+            '--norestore',
+            '--nolockcheck',
+            f'-env:UserInstallation={profile_dir.as_uri()}',
+            f'--accept=socket,host={SOFFICE_HOST},port={SOFFICE_PORT};urp;'
+        ]
+        
+        env = os.environ.copy()
+        env['HOME'] = tempfile.gettempdir()
+        env['TMPDIR'] = tempfile.gettempdir()
+        
+        logger.info(f"Starting LibreOffice UNO daemon: {' '.join(cmd)}")
+        soffice_process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        return soffice_process
+
+def stop_libreoffice_daemon():
+    """Terminate the soffice daemon when the app shuts down"""
+    if soffice_process is not None and soffice_process.poll() is None:
+        soffice_process.terminate()
+        try:
+            soffice_process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            soffice_process.kill()
+
+def kill_hung_libreoffice_daemon(process, timed_out):
+    """Watchdog for UNO conversions: kill a soffice daemon stuck on a document and start a new one"""
+    logger.error(f"❌ LibreOffice conversion exceeded {SOFFICE_CONVERSION_TIMEOUT}s - restarting the UNO daemon")
+    timed_out.set()
+    process.kill()
+    process.wait()
+    start_libreoffice_daemon()
+
+def wait_for_libreoffice_daemon(timeout):
+    """Wait until the soffice daemon accepts connections on its UNO socket"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((SOFFICE_HOST, SOFFICE_PORT), timeout=1):
+                return True
+        except OSError:
+            if soffice_process is None or soffice_process.poll() is not None:
+                return False
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+
 def check_libreoffice_installation():
-    """Check if LibreOffice is properly installed"""
+    """Check if LibreOffice is available, re-probing at most every LIBREOFFICE_CHECK_TTL seconds"""
+    global libreoffice_status
+    
+    status = libreoffice_status
+    if status is not None and time.monotonic() - status[0] <= LIBREOFFICE_CHECK_TTL:
+        return status[1]
+    
+    # One thread probes (a daemon restart can take SOFFICE_STARTUP_TIMEOUT seconds);
+    # the others answer with the previous result meanwhile, or wait for the first one
+    if not libreoffice_probe_lock.acquire(blocking=status is None):
+        return status[1]
+    try:
+        status = libreoffice_status
+        if status is None or time.monotonic() - status[0] > LIBREOFFICE_CHECK_TTL:
+            status = (time.monotonic(), probe_libreoffice())
+            libreoffice_status = status
+        return status[1]
+    finally:
+        libreoffice_probe_lock.release()
+
+def invalidate_libreoffice_status():
+    """Make the next check_libreoffice_installation() call probe LibreOffice again"""
+    global libreoffice_status
+    
+    status = libreoffice_status
+    if status is not None:
+        libreoffice_status = (float('-inf'), status[1])  # expired, but still an answer while re-probing
+
+def probe_libreoffice():
+    """Check if LibreOffice is properly installed and its UNO daemon is reachable"""
+    if UNO_AVAILABLE:
+        # Restart the daemon if it has died, then probe its socket
+        if start_libreoffice_daemon() is None:
+            return False
+        if wait_for_libreoffice_daemon(timeout=SOFFICE_STARTUP_TIMEOUT):
+            return True
+        logger.error(f"LibreOffice UNO daemon is not accepting connections on port {SOFFICE_PORT}")
+        return False
+    
     try:
         result = subprocess.run(['libreoffice', '--version'], 
                               capture_output=True, text=True, timeout=10)
@@ -108,6 +630,194 @@ def check_libreoffice_installation():
         logger.error(f"LibreOffice check failed: {e}")
         return False
 
+def uno_property(name, value):
+    """Build a com.sun.star.beans.PropertyValue"""
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+def connect_uno_desktop():
+    """Connect to the soffice daemon and return its Desktop service"""
+    if start_libreoffice_daemon() is None:
+        raise Exception("LibreOffice daemon could not be started")
+    
+    if not wait_for_libreoffice_daemon(timeout=SOFFICE_STARTUP_TIMEOUT):
+        raise Exception(f"LibreOffice daemon did not open UNO socket on port {SOFFICE_PORT}")
+    
+    local_context = uno.getComponentContext()
+    resolver = local_context.ServiceManager.createInstanceWithContext(
+        'com.sun.star.bridge.UnoUrlResolver', local_context
+    )
+    context = resolver.resolve(
+        f'uno:socket,host={SOFFICE_HOST},port={SOFFICE_PORT};urp;StarOffice.ComponentContext'
+    )
+    return context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+
+def warm_pdf2docx():
+    """Convert a one-page document so pdf2docx's parsers and font caches are loaded"""
+    with tempfile.TemporaryDirectory(prefix=worker_folder_prefix(os.getpid()), dir=SCRATCH_ROOT) as work_dir:
+        pdf_path = os.path.join(work_dir, 'warm-up.pdf')
+        document = fitz.open()
+        try:
+            document.new_page().insert_text((72, 72), "Warm-up")
+            document.save(pdf_path)
+        finally:
+            document.close()
+        
+        run_pdf2docx(pdf_path, os.path.join(work_dir, 'warm-up.docx'))
+
+def run_pdf2docx(pdf_path, docx_path):
+    """Convert a whole PDF in the current process; runs inside the warm worker pool"""
+    cv = Converter(pdf_path)
+    try:
+        cv.convert(docx_path, start=0, end=None)
+    finally:
+        cv.close()
+
+def start_pdf2docx_pool():
+    """
+    Warm pdf2docx up in this process, then fork the worker pool from it so every
+    worker (including the ones maxtasksperchild replaces) starts warm. The process
+    already runs threads (at least the log listener), so workers only ever touch
+    pdf2docx and get their own log listener from the at-fork hook.
+    """
+    global pdf2docx_pool
+    
+    if not PDF2DOCX_AVAILABLE or PDF2DOCX_POOL_SIZE <= 0:
+        return
+    
+    # A warm-up that fails here would fail in every worker too; converting in the
+    # request thread beats a pool that never gets a worker up
+    try:
+        warm_pdf2docx()
+    except Exception as e:
+        logger.warning(f"⚠️  pdf2docx warm-up failed, converting in the request thread: {str(e)}")
+        return
+    
+    pdf2docx_pool = make_pdf2docx_pool()
+    logger.info(f"Started {PDF2DOCX_POOL_SIZE} warm pdf2docx workers")
+
+def make_pdf2docx_pool():
+    """Fork PDF2DOCX_POOL_SIZE pdf2docx workers from this (already warm) process"""
+    return multiprocessing.get_context('fork').Pool(
+        processes=PDF2DOCX_POOL_SIZE,
+        maxtasksperchild=PDF2DOCX_POOL_MAX_TASKS
+    )
+
+def replace_pdf2docx_pool(pool):
+    """Terminate a stuck pool and fork a fresh one, unless another thread already did"""
+    global pdf2docx_pool
+    
+    with pdf2docx_pool_lock:
+        if pdf2docx_pool is not pool:
+            return
+        logger.error(f"❌ pdf2docx pool conversion exceeded {PDF2DOCX_POOL_TIMEOUT}s - replacing the pool")
+        pdf2docx_pool = make_pdf2docx_pool()
+    
+    # terminate() blocks forever if a worker was killed while holding the task
+    # queue's lock, so the old pool is torn down off the request thread
+    threading.Thread(target=pool.terminate, daemon=True).start()
+
+def convert_in_pdf2docx_pool(pdf_path, docx_path):
+    """
+    Convert a PDF on the warm worker pool. multiprocessing.Pool loses the task of a
+    worker that dies (MuPDF crash, OOM killer), so waits are bounded and a stuck
+    pool is replaced rather than left to hang the request thread.
+    """
+    pool = pdf2docx_pool
+    result = pool.apply_async(run_pdf2docx, (pdf_path, docx_path))
+    deadline = time.monotonic() + PDF2DOCX_POOL_TIMEOUT
+    
+    while True:
+        try:
+            return result.get(timeout=1)
+        except multiprocessing.TimeoutError:
+            # A replaced pool was terminated along with this task
+            if pdf2docx_pool is not pool:
+                raise Exception("pdf2docx worker pool was replaced during the conversion")
+            if time.monotonic() >= deadline:
+                replace_pdf2docx_pool(pool)
+                raise Exception(f"pdf2docx conversion timeout after {PDF2DOCX_POOL_TIMEOUT} seconds")
+
+def stop_pdf2docx_pool():
+    """Terminate the warm pdf2docx worker pool, if one is running"""
+    global pdf2docx_pool
+    
+    with pdf2docx_pool_lock:
+        if pdf2docx_pool is not None:
+            pdf2docx_pool.terminate()
+            pdf2docx_pool = None
+
+def pdf2docx_process_count(page_count):
+    """Number of processes pdf2docx should convert a document of page_count pages with"""
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        return 1  # forking costs more than it saves on tiny documents
+    
+    if multiprocessing.current_process().daemon:
+        return 1  # daemonic pool workers (e.g. Celery prefork) cannot have children
+    
+    # Leave one core for the web server; honour CONVERT_CPU_COUNT under WSGI workers
+    workers = max(1, (os.cpu_count() or 1) - 1)
+    if CONVERT_CPU_COUNT > 0:
+        workers = min(workers, CONVERT_CPU_COUNT)
+    
+    return min(workers, page_count)
+
+def convert_pages_in_parallel(cv, docx_path, workers):
+    """
+    Run a pdf2docx multi-process conversion. pdf2docx exchanges parsed pages through
+    pages-N.json files in the current directory, so each run gets a private one.
+    """
+    docx_path = os.path.abspath(docx_path)
+    
+    with pdf2docx_parallel_lock:
+        work_dir = tempfile.mkdtemp(prefix=worker_folder_prefix(os.getpid()), dir=SCRATCH_ROOT)
+        previous_dir = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            cv.convert(docx_path, start=0, end=None, multi_processing=True, cpu_count=workers)
+        finally:
+            os.chdir(previous_dir)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+def validate_docx_structure(docx_path):
+    """
+    Open a DOCX as a ZIP and check that its essential parts are present and readable
+    """
+    logger.info("Validating DOCX file structure...")
+    
+    try:
+        with zipfile.ZipFile(docx_path, 'r') as zip_file:
+            zip_contents = zip_file.namelist()
+            logger.info(f"DOCX contains {len(zip_contents)} files")
+            
+            # Check for essential DOCX components
+            required_files = ['[Content_Types].xml', 'word/document.xml']
+            missing_files = []
+            
+            for req_file in required_files:
+                if req_file not in zip_contents:
+                    missing_files.append(req_file)
+            
+            if missing_files:
+                raise Exception(f"DOCX missing essential files: {missing_files}")
+            
+            # Try to read the main document
+            try:
+                document_xml = zip_file.read('word/document.xml')
+                if len(document_xml) < 50:
+                    raise Exception("Document XML is too small - likely corrupted")
+                else:
+                    logger.info(f"Document XML size: {len(document_xml)} bytes")
+            except KeyError:
+                raise Exception("Could not read word/document.xml - DOCX is corrupted")
+            
+            logger.info("✅ DOCX structure validation passed")
+            
+    except zipfile.BadZipFile as e:
+        raise Exception(f"Generated DOCX is not a valid ZIP file: {e}")
+
 def convert_pdf_to_docx_with_pdf2docx(pdf_path, docx_path):
     """
     Convert PDF to DOCX using pdf2docx library - much more reliable than LibreOffice
@@ -139,27 +849,39 @@ def convert_pdf_to_docx_with_pdf2docx(pdf_path, docx_path):
         # Convert PDF to DOCX using pdf2docx
         logger.info("Starting pdf2docx conversion...")
         
-        # Create converter instance
-        cv = Converter(pdf_path)
+        # Create converter instance (worker processes reopen the PDF by its absolute path)
+        cv = Converter(os.path.abspath(pdf_path))
+        
+        # Write to a side file and rename it into place, so the output path
+        # never holds a half-written document
+        partial_path = docx_path + '.part'
         
         # Convert with progress tracking
         try:
-            cv.convert(docx_path, start=0, end=None)  # Convert all pages
+            page_count = len(cv.fitz_doc)
+            workers = pdf2docx_process_count(page_count)
+            
+            if workers > 1:
+                logger.info(f"Converting {page_count} pages with {workers} processes")
+                convert_pages_in_parallel(cv, partial_path, workers)
+            elif pdf2docx_pool is not None:
+                convert_in_pdf2docx_pool(cv.filename_pdf, partial_path)
+            else:
+                cv.convert(partial_path, start=0, end=None)  # Convert all pages
             cv.close()
-            logger.info("✅ pdf2docx conversion completed")
+            os.replace(partial_path, docx_path)
+            logger.debug("pdf2docx conversion completed")
         except Exception as e:
             cv.close()
+            Path(partial_path).unlink(missing_ok=True)
             raise Exception(f"pdf2docx conversion failed: {str(e)}")
         
-        # Wait for file system to sync
-        time.sleep(0.5)
-        
         # Validate output file
         if not os.path.exists(docx_path):
             raise Exception("pdf2docx did not create output file")
         
         output_size = os.path.getsize(docx_path)
-        logger.info(f"Output DOCX size: {output_size} bytes")
+        logger.debug("Output DOCX size: %d bytes", output_size)
         
         if output_size == 0:
             raise Exception("Output DOCX file is empty")
@@ -167,41 +889,16 @@ def convert_pdf_to_docx_with_pdf2docx(pdf_path, docx_path):
         if output_size < 100:  # Very small files are likely corrupted
             raise Exception(f"Output DOCX file is suspiciously small ({output_size} bytes)")
         
-        # Validate DOCX structure
-        logger.info("Validating DOCX file structure...")
+        # pdf2docx reports failures as exceptions, so a ZIP header is enough here;
+        # walk the archive only when debugging
+        with open(docx_path, 'rb') as fh:
+            if fh.read(4) != b'PK\x03\x04':
+                raise Exception("Generated DOCX is not a valid ZIP file")
         
-        try:
-            with zipfile.ZipFile(docx_path, 'r') as zip_file:
-                zip_contents = zip_file.namelist()
-                logger.info(f"DOCX contains {len(zip_contents)} files")
-                
-                # Check for essential DOCX components
-                required_files = ['[Content_Types].xml', 'word/document.xml']
-                missing_files = []
-                
-                for req_file in required_files:
-                    if req_file not in zip_contents:
-                        missing_files.append(req_file)
-                
-                if missing_files:
-                    raise Exception(f"DOCX missing essential files: {missing_files}")
-                
-                # Try to read the main document
-                try:
-                    document_xml = zip_file.read('word/document.xml')
-                    if len(document_xml) < 50:
-                        raise Exception("Document XML is too small - likely corrupted")
-                    else:
-                        logger.info(f"Document XML size: {len(document_xml)} bytes")
-                except KeyError:
-                    raise Exception("Could not read word/document.xml - DOCX is corrupted")
-                
-                logger.info("✅ DOCX structure validation passed")
-                
-        except zipfile.BadZipFile as e:
-            raise Exception(f"Generated DOCX is not a valid ZIP file: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            validate_docx_structure(docx_path)
         
-        logger.info(f"✅ PDF to DOCX conversion successful: {docx_path}")
+        logger.debug("PDF to DOCX conversion successful: %s", docx_path)
         return docx_path
         
     except Exception as e:
@@ -234,8 +931,7 @@ def convert_with_libreoffice(input_path, output_dir, output_format):
             raise Exception(f"Output directory is not writable: {output_dir}")
         
         # Get input file info
-        input_path_obj = Path(input_path)
-        input_name = input_path_obj.stem
+        input_name = os.path.splitext(os.path.basename(input_path))[0]
         
         # Define expected output file
         output_filename = f"{input_name}.{output_format}"
@@ -246,69 +942,25 @@ def convert_with_libreoffice(input_path, output_dir, output_format):
             os.remove(expected_output)
             logger.info(f"Removed existing output file: {expected_output}")
         
-        # Build LibreOffice command
-        cmd = [
-            'libreoffice',
-            '--headless',
-            '--convert-to', output_format,
-            '--outdir', str(output_dir),
-            str(input_path)
-        ]
-        
-        logger.info(f"LibreOffice command: {' '.join(cmd)}")
-        
-        # Set up environment for headless operation
-        env = os.environ.copy()
-        env['HOME'] = tempfile.gettempdir()
-        env['TMPDIR'] = tempfile.gettempdir()
-        
-        # Run LibreOffice conversion
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minutes timeout
-                env=env,
-                cwd=output_dir
-            )
-            
-            logger.info(f"LibreOffice exit code: {result.returncode}")
-            if result.stdout:
-                logger.info(f"LibreOffice stdout: {result.stdout}")
-            if result.stderr:
-                logger.info(f"LibreOffice stderr: {result.stderr}")
-            
-            if result.returncode != 0:
-                error_msg = f"LibreOffice failed with exit code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
-                raise Exception(error_msg)
-                
-        except subprocess.TimeoutExpired:
-            raise Exception("LibreOffice conversion timeout - file may be too large or complex")
-        
-        # Wait for file system to sync
-        time.sleep(1)
+        # Both paths rename the finished document into place, so the output
+        # path never holds a half-written file
+        if UNO_AVAILABLE and output_format.lower() in UNO_EXPORT_FILTERS:
+            partial_output = expected_output.with_name(expected_output.name + '.part')
+            try:
+                convert_with_uno(input_path, partial_output, output_format.lower())
+                os.replace(partial_output, expected_output)
+            finally:
+                partial_output.unlink(missing_ok=True)
+        else:
+            convert_with_libreoffice_cli(input_path, expected_output, output_format)
         
         # Check if output file was created
         if not expected_output.exists():
-            # Try to find the file with different naming
-            possible_files = list(Path(output_dir).glob(f"{input_name}.*"))
-            logger.info(f"Possible output files: {[str(f) for f in possible_files]}")
-            
-            for pf in possible_files:
-                if pf.suffix.lower() == f'.{output_format.lower()}':
-                    expected_output = pf
-                    logger.info(f"Found output file: {expected_output}")
-                    break
-            
-            if not expected_output.exists():
-                raise Exception(f"LibreOffice did not create output file. Expected: {expected_output}")
+            raise Exception(f"LibreOffice did not create output file. Expected: {expected_output}")
         
         # Validate output file
         output_size = expected_output.stat().st_size
-        logger.info(f"Output file size: {output_size} bytes")
+        logger.debug("Output file size: %d bytes", output_size)
         
         if output_size == 0:
             raise Exception("Output file is empty")
@@ -316,13 +968,146 @@ def convert_with_libreoffice(input_path, output_dir, output_format):
         if output_size < 50:
             raise Exception(f"Output file is suspiciously small ({output_size} bytes)")
         
-        logger.info(f"✅ LibreOffice conversion successful: {expected_output}")
+        logger.debug("LibreOffice conversion successful: %s", expected_output)
         return str(expected_output)
         
     except Exception as e:
         logger.error(f"❌ LibreOffice conversion failed: {str(e)}")
         raise Exception(f"LibreOffice conversion failed: {str(e)}")
 
+def convert_with_uno(input_path, output_path, output_format):
+    """
+    Convert a document through the persistent LibreOffice daemon over UNO
+    """
+    input_url = uno.systemPathToFileUrl(os.path.abspath(input_path))
+    output_url = uno.systemPathToFileUrl(os.path.abspath(str(output_path)))
+    
+    logger.info(f"UNO conversion: {input_url} -> {output_url}")
+    
+    # Requests queue up here; soffice handles one document at a time
+    with uno_lock:
+        try:
+            desktop = connect_uno_desktop()
+        except Exception:
+            invalidate_libreoffice_status()  # re-probe before trusting LibreOffice again
+            raise
+        
+        # UNO calls have no timeout of their own; killing the daemon makes a
+        # stuck call fail instead of holding uno_lock forever
+        timed_out = threading.Event()
+        watchdog = threading.Timer(
+            SOFFICE_CONVERSION_TIMEOUT, kill_hung_libreoffice_daemon, (soffice_process, timed_out)
+        )
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            document = desktop.loadComponentFromURL(
+                input_url, '_blank', 0, (uno_property('Hidden', True),)
+            )
+            if document is None:
+                raise Exception("LibreOffice could not open the input document")
+            
+            try:
+                document.storeToURL(
+                    output_url,
+                    (uno_property('FilterName', UNO_EXPORT_FILTERS[output_format]),)
+                )
+            finally:
+                document.close(True)
+        except Exception:
+            # A dead or killed daemon is LibreOffice's fault; an unreadable document is not
+            if timed_out.is_set() or soffice_process.poll() is not None:
+                invalidate_libreoffice_status()
+            if timed_out.is_set():
+                raise Exception(f"LibreOffice conversion timeout after {SOFFICE_CONVERSION_TIMEOUT} seconds - file may be too large or complex")
+            raise
+        finally:
+            watchdog.cancel()
+
+def convert_with_libreoffice_cli(input_path, output_path, output_format):
+    """
+    Convert a document by spawning a one-off headless LibreOffice process
+    """
+    # LibreOffice writes into a private directory next to the output; the
+    # result is renamed into place once the process has exited
+    output_dir = tempfile.mkdtemp(dir=os.path.dirname(str(output_path)))
+    try:
+        run_libreoffice_cli(input_path, output_dir, output_format)
+        
+        possible_files = list(Path(output_dir).glob(f"*.{output_format}"))
+        logger.info(f"Possible output files: {[str(f) for f in possible_files]}")
+        
+        if not possible_files:
+            raise Exception(f"LibreOffice did not create output file. Expected: {output_path}")
+        
+        os.replace(possible_files[0], output_path)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+def run_libreoffice_cli(input_path, output_dir, output_format):
+    """
+    Run headless LibreOffice on one document, writing its output into output_dir
+    """
+    # Build LibreOffice command
+    cmd = [
+        'libreoffice',
+        '--headless',
+        '--convert-to', output_format,
+        '--outdir', str(output_dir),
+        str(input_path)
+    ]
+    
+    logger.info(f"LibreOffice command: {' '.join(cmd)}")
+    
+    # Set up environment for headless operation
+    env = os.environ.copy()
+    env['HOME'] = tempfile.gettempdir()
+    env['TMPDIR'] = tempfile.gettempdir()
+    
+    # Run LibreOffice conversion
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=SOFFICE_CONVERSION_TIMEOUT,
+            env=env,
+            cwd=output_dir
+        )
+            
+        logger.info(f"LibreOffice exit code: {result.returncode}")
+        if result.stdout:
+            logger.info(f"LibreOffice stdout: {result.stdout}")
+        if result.stderr:
+            logger.info(f"LibreOffice stderr: {result.stderr}")
+            
+        if result.returncode != 0:
+            error_msg = f"LibreOffice failed with exit code {result.returncode}"
+            if result.stderr:
+                error_msg += f": {result.stderr}"
+            raise Exception(error_msg)
+                
+    except subprocess.TimeoutExpired:
+        invalidate_libreoffice_status()
+        raise Exception("LibreOffice conversion timeout - file may be too large or complex")
+    except OSError as e:
+        invalidate_libreoffice_status()  # the binary is gone or cannot be run
+        raise Exception(f"LibreOffice could not be started: {str(e)}")
+
+def is_plausible_pdf(pdf_path):
+    """
+    Cheap structural sniff: a PDF starts with a %PDF- header and ends with a
+    startxref pointer. Full parsing is left to pikepdf.
+    """
+    with open(pdf_path, 'rb') as f:
+        # Readers accept up to 1 KB of junk before the header
+        if b'%PDF-' not in f.read(1024):
+            return False
+        
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 1024))
+        return b'startxref' in f.read()
+
 def merge_pdfs(pdf_paths, output_path):
     """
     Merge multiple PDF files into one
@@ -330,37 +1115,50 @@ def merge_pdfs(pdf_paths, output_path):
     try:
         logger.info(f"Starting PDF merge: {len(pdf_paths)} files -> {output_path}")
         
-        pdf_writer = PyPDF2.PdfWriter()
-        
-        for i, pdf_path in enumerate(pdf_paths):
-            logger.info(f"Processing PDF {i+1}/{len(pdf_paths)}: {pdf_path}")
-            
+        for pdf_path in pdf_paths:
             if not os.path.exists(pdf_path):
                 raise Exception(f"PDF file does not exist: {pdf_path}")
             
+            if not is_plausible_pdf(pdf_path):
+                raise Exception(f"Not a valid PDF file: {os.path.basename(pdf_path)}")
+        
+        def open_pdf(pdf_path):
             try:
-                with open(pdf_path, 'rb') as pdf_file:
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-                    
-                    # Check if PDF is valid
-                    if len(pdf_reader.pages) == 0:
-                        raise Exception(f"PDF file has no pages: {pdf_path}")
-                    
-                    logger.info(f"PDF {i+1} has {len(pdf_reader.pages)} pages")
-                    
-                    # Add all pages from this PDF
-                    for page_num in range(len(pdf_reader.pages)):
-                        page = pdf_reader.pages[page_num]
-                        pdf_writer.add_page(page)
-                        
+                return pikepdf.Pdf.open(pdf_path)
             except Exception as e:
                 logger.error(f"Error processing PDF {pdf_path}: {e}")
                 raise Exception(f"Error processing PDF {os.path.basename(pdf_path)}: {str(e)}")
         
-        # Write the merged PDF
-        logger.info(f"Writing merged PDF to: {output_path}")
-        with open(output_path, 'wb') as output_file:
-            pdf_writer.write(output_file)
+        # qpdf releases the GIL while parsing, so open all inputs concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(pdf_paths))) as executor:
+            futures = [executor.submit(open_pdf, pdf_path) for pdf_path in pdf_paths]
+        
+        try:
+            with pikepdf.Pdf.new() as merged_pdf:
+                for i, (pdf_path, future) in enumerate(zip(pdf_paths, futures)):
+                    logger.info(f"Processing PDF {i+1}/{len(pdf_paths)}: {pdf_path}")
+                    source_pdf = future.result()
+                    logger.info(f"PDF {i+1} has {len(source_pdf.pages)} pages")
+                    
+                    # Add all pages from this PDF
+                    merged_pdf.pages.extend(source_pdf.pages)
+                
+                # Drop resources no page references any more; shared fonts and
+                # images are kept once and packed into compressed object streams
+                merged_pdf.remove_unreferenced_resources()
+                
+                # Write the merged PDF
+                logger.info(f"Writing merged PDF to: {output_path}")
+                merged_pdf.save(
+                    output_path,
+                    linearize=False,
+                    object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                    stream_decode_level=pikepdf.StreamDecodeLevel.none
+                )
+        finally:
+            for future in futures:
+                if future.exception() is None:
+                    future.result().close()
         
         # Verify the output file
         if not os.path.exists(output_path):
@@ -369,43 +1167,38 @@ def merge_pdfs(pdf_paths, output_path):
         if os.path.getsize(output_path) == 0:
             raise Exception("Merged PDF file is empty")
         
-        logger.info(f"PDF merge successful: {output_path} (size: {os.path.getsize(output_path)} bytes)")
+        logger.debug("PDF merge successful: %s", output_path)
         return output_path
         
     except Exception as e:
         logger.error(f"PDF merge error: {str(e)}")
         raise Exception(f"PDF merge error: {str(e)}")
 
-def images_to_pdf(image_paths, output_path):
+def images_to_pdf(image_paths, output):
     """
-    Convert multiple images to a single PDF
+    Convert multiple images to a single PDF, written to a path or a binary file object
     """
     try:
-        logger.info(f"Starting image to PDF conversion: {len(image_paths)} images -> {output_path}")
+        logger.info(f"Starting image to PDF conversion: {len(image_paths)} images -> {output}")
         
-        c = canvas.Canvas(output_path, pagesize=letter)
+        c = canvas.Canvas(output, pagesize=letter)
         page_width, page_height = letter
         
         processed_images = 0
         
         for i, image_path in enumerate(image_paths):
             try:
-                logger.info(f"Processing image {i+1}/{len(image_paths)}: {image_path}")
+                logger.info("Processing image %d/%d: %s", i + 1, len(image_paths), image_path)
                 
                 if not os.path.exists(image_path):
-                    logger.warning(f"Image file does not exist: {image_path}")
+                    logger.warning("Image file does not exist: %s", image_path)
                     continue
                 
                 # Open and process the image
                 with Image.open(image_path) as img:
-                    # Convert to RGB if necessary
-                    if img.mode != 'RGB':
-                        logger.info(f"Converting image mode from {img.mode} to RGB")
-                        img = img.convert('RGB')
-                    
                     # Calculate scaling to fit page while maintaining aspect ratio
                     img_width, img_height = img.size
-                    logger.info(f"Image dimensions: {img_width}x{img_height}")
+                    logger.info("Image dimensions: %dx%d", img_width, img_height)
                     
                     # Leave margins (50 points on each side)
                     max_width = page_width - 100
@@ -424,20 +1217,47 @@ def images_to_pdf(image_paths, output_path):
                     x = (page_width - new_width) / 2
                     y = (page_height - new_height) / 2
                     
-                    logger.info(f"Scaled dimensions: {new_width:.1f}x{new_height:.1f} at ({x:.1f}, {y:.1f})")
+                    logger.info("Scaled dimensions: %.1fx%.1f at (%.1f, %.1f)", new_width, new_height, x, y)
                     
-                    # Save image to bytes for reportlab
-                    img_buffer = io.BytesIO()
-                    img.save(img_buffer, format='JPEG', quality=85)
-                    img_buffer.seek(0)
+                    if img.format == 'JPEG':
+                        # reportlab embeds JPEG data as-is (DCTDecode), without decoding it;
+                        # go by the decoded format, not the suffix, which the client chose
+                        image_reader = ImageReader(image_path)
+                    else:
+                        # Pixel size needed to draw the image at IMAGE_PDF_DPI
+                        target_size = (
+                            max(1, int(new_width * IMAGE_PDF_DPI / 72)),
+                            max(1, int(new_height * IMAGE_PDF_DPI / 72))
+                        )
+                        
+                        # Composite transparent images onto white; a plain RGB
+                        # conversion would turn transparent pixels black
+                        if 'A' in img.getbands() or 'transparency' in img.info:
+                            logger.info("Compositing %s image onto white", img.mode)
+                            img = img.convert('RGBA')
+                            background = Image.new('RGB', img.size, 'white')
+                            background.paste(img, mask=img.getchannel('A'))
+                            img = background
+                        
+                        # Convert to RGB if necessary
+                        if img.mode != 'RGB':
+                            logger.info("Converting image mode from %s to RGB", img.mode)
+                            img = img.convert('RGB')
+                        
+                        # Downscale before embedding; thumbnail never enlarges
+                        img.thumbnail(target_size, Image.Resampling.LANCZOS)
+                        logger.info("Resampled to %dx%d for %d DPI", img.width, img.height, IMAGE_PDF_DPI)
+                        
+                        # Hand the decoded pixels to reportlab directly (Flate-compressed)
+                        image_reader = ImageReader(img)
                     
                     # Draw image on PDF
-                    c.drawImage(ImageReader(img_buffer), x, y, new_width, new_height)
+                    c.drawImage(image_reader, x, y, new_width, new_height)
                     c.showPage()  # Start new page for next image
                     processed_images += 1
                     
             except Exception as e:
-                logger.error(f"Error processing image {image_path}: {e}")
+                logger.error("Error processing image %s: %s", image_path, e)
                 continue
         
         if processed_images == 0:
@@ -445,33 +1265,289 @@ def images_to_pdf(image_paths, output_path):
         
         c.save()
         
-        # Verify the output file
-        if not os.path.exists(output_path):
-            raise Exception("Failed to create PDF file")
+        # Verify the output
+        if isinstance(output, (str, os.PathLike)):
+            if not os.path.exists(output):
+                raise Exception("Failed to create PDF file")
+            output_size = os.path.getsize(output)
+        else:
+            output_size = output.tell()
         
-        if os.path.getsize(output_path) == 0:
+        if output_size == 0:
             raise Exception("Generated PDF file is empty")
         
-        logger.info(f"Image to PDF conversion successful: {processed_images} images processed, output: {output_path} (size: {os.path.getsize(output_path)} bytes)")
-        return output_path
+        logger.debug("Image to PDF conversion successful: %d images processed, output: %s (size: %d bytes)", processed_images, output, output_size)
+        return output
         
     except Exception as e:
         logger.error(f"Image to PDF conversion error: {str(e)}")
         raise Exception(f"Image to PDF conversion error: {str(e)}")
 
-def cleanup_files_after_response(file_paths):
-    """Clean up files after the response is sent"""
-    def cleanup():
-        time.sleep(3)  # Wait 3 seconds to ensure download completes
-        for file_path in file_paths:
+def image_set_cache_key(image_paths):
+    """Content hash of an ordered list of images; equal keys produce the same PDF"""
+    key = hashlib.blake2b(digest_size=16)
+    for image_path in image_paths:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(image_path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(UPLOAD_COPY_BUFFER_SIZE), b''):
+                digest.update(chunk)
+        key.update(digest.digest())
+    return key.hexdigest()
+
+def open_cached_image_pdf(cache_key):
+    """Open the cached PDF for cache_key and mark it recently used. Returns None on a miss"""
+    cache_path = os.path.join(app.config['CONVERTED_FOLDER'], f"cache_{cache_key}.pdf")
+    try:
+        fh = open(cache_path, 'rb')
+    except FileNotFoundError:
+        return None
+    
+    os.utime(fh.fileno())  # eviction order is mtime order
+    return fh
+
+def store_cached_image_pdf(cache_key, pdf_data):
+    """Save a generated image PDF under cache_key, evicting the least recently used entries"""
+    folder = app.config['CONVERTED_FOLDER']
+    partial_path = os.path.join(folder, f"{new_id()}.part")
+    with open(partial_path, 'wb') as fh:
+        fh.write(pdf_data)
+    os.replace(partial_path, os.path.join(folder, f"cache_{cache_key}.pdf"))
+    
+    evict_cached_image_pdfs()
+
+def evict_cached_image_pdfs():
+    """
+    Trim the image PDF cache to IMAGE_PDF_CACHE_SIZE, least recently used first. The
+    cache shares the scratch space with uploads, so it also gives up entries while less
+    than twice MIN_FREE_SCRATCH_SPACE is free; it should never be why uploads are refused.
+    """
+    folder = app.config['CONVERTED_FOLDER']
+    entries = []
+    for entry in os.scandir(folder):
+        if entry.name.startswith('cache_') and entry.name.endswith('.pdf'):
             try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"Cleaned up file: {file_path}")
-            except Exception as e:
-                logger.error(f"Error cleaning up file {file_path}: {e}")
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # removed by the stale-file reaper meanwhile
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
     
-    return cleanup
+    # Keep the most recently used entries that fit in IMAGE_PDF_CACHE_SIZE
+    cached_bytes = 0
+    kept = []
+    evicted = []
+    free_space = shutil.disk_usage(folder).free
+    for mtime, size, path in sorted(entries, reverse=True):
+        cached_bytes += size
+        if cached_bytes > IMAGE_PDF_CACHE_SIZE:
+            evicted.append(path)
+            free_space += size
+        else:
+            kept.append((size, path))
+    
+    # Then the oldest of the rest while scratch space is short
+    while kept and free_space < MIN_FREE_SCRATCH_SPACE * 2:
+        size, path = kept.pop()
+        evicted.append(path)
+        free_space += size
+    
+    unlink_files(evicted)
+
+def schedule_cleanup(file_paths):
+    """
+    Queue files for the janitor thread to remove CLEANUP_DELAY seconds from now.
+    file_paths may be any iterable; the janitor consumes it when the files are due.
+    """
+    cleanup_queue.put((time.monotonic() + CLEANUP_DELAY, file_paths))
+
+def run_janitor():
+    """Remove queued files once their delay has passed, unlinking everything due in one batch"""
+    while True:
+        try:
+            # Sleep until the oldest pending batch is due or more files are queued
+            timeout = None
+            if cleanup_pending:
+                timeout = max(0, cleanup_pending[0][0] - time.monotonic())
+            
+            try:
+                cleanup_pending.append(cleanup_queue.get(timeout=timeout))
+                while True:
+                    cleanup_pending.append(cleanup_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            # Every batch has the same delay, so the deque is ordered by due time
+            current_time = time.monotonic()
+            due_files = []
+            while cleanup_pending and cleanup_pending[0][0] <= current_time:
+                due_files.extend(cleanup_pending.popleft()[1])
+            
+            if due_files:
+                for file_path in unlink_files(due_files):
+                    logger.debug("Cleaned up file: %s", file_path)
+                    
+        except Exception as e:
+            logger.error(f"Janitor error: {e}")
+            time.sleep(1)
+
+def flush_cleanup_queue():
+    """Remove every file still waiting for the janitor, so none outlive the process"""
+    file_paths = []
+    while True:
+        try:
+            file_paths.extend(cleanup_queue.get_nowait()[1])
+        except queue.Empty:
+            break
+    for _, pending_paths in list(cleanup_pending):
+        file_paths.extend(pending_paths)
+    
+    unlink_files(file_paths)
+
+def start_janitor():
+    """Start the thread that removes files after their response has been sent"""
+    threading.Thread(target=run_janitor, daemon=True).start()
+    atexit.register(flush_cleanup_queue)
+
+if CELERY_AVAILABLE:
+    celery_app = Celery('converter', broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+    
+    @worker_process_init.connect
+    def init_celery_worker_process(**kwargs):
+        """Each prefork child drives its own LibreOffice daemon"""
+        start_private_libreoffice_daemon()
+    
+    @celery_app.task(name='converter.pdf_to_word')
+    def pdf_to_word_task(pdf_path, docx_path, download_name):
+        convert_pdf_to_docx_with_pdf2docx(pdf_path, docx_path)
+        return {'path': docx_path, 'download_name': download_name}
+    
+    @celery_app.task(name='converter.pdf_to_word_pages')
+    def pdf_to_word_pages_task(pdf_path, docx_path, start, end):
+        """Convert pages [start, end) of a PDF into a partial DOCX"""
+        logger.info(f"Converting pages {start + 1}-{end} of {pdf_path}")
+        cv = Converter(pdf_path)
+        try:
+            cv.convert(docx_path, start=start, end=end)
+        finally:
+            cv.close()
+        return docx_path
+    
+    @celery_app.task(name='converter.join_docx_parts')
+    def join_docx_parts_task(part_paths, docx_path, download_name):
+        """Join the partial DOCX files of a batched conversion, in page order"""
+        composer = Composer(Document(part_paths[0]))
+        for part_path in part_paths[1:]:
+            composer.append(Document(part_path))
+        composer.save(docx_path)
+        
+        unlink_files(part_paths)
+        logger.debug("Joined %d page batches into %s", len(part_paths), docx_path)
+        return {'path': docx_path, 'download_name': download_name}
+    
+    @celery_app.task(name='converter.word_to_pdf')
+    def word_to_pdf_task(word_path, output_dir, download_name):
+        pdf_path = convert_with_libreoffice(word_path, output_dir, 'pdf')
+        return {'path': pdf_path, 'download_name': download_name}
+    
+    @celery_app.task(name='converter.merge_pdfs')
+    def merge_pdfs_task(pdf_paths, output_path, download_name):
+        merge_pdfs(pdf_paths, output_path)
+        return {'path': output_path, 'download_name': download_name}
+    
+    @celery_app.task(name='converter.images_to_pdf')
+    def images_to_pdf_task(image_paths, output_path, download_name):
+        images_to_pdf(image_paths, output_path)
+        return {'path': output_path, 'download_name': download_name}
+
+def async_requested():
+    """Clients opt in to background conversion with ?async=1"""
+    return request.args.get('async', '').lower() in ('1', 'true')
+
+def pdf_to_word_job(pdf_path, docx_path, download_name):
+    """Build the Celery job for a PDF to Word conversion, fanned out in page batches for long PDFs"""
+    with pikepdf.Pdf.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+    
+    if page_count <= JOB_BATCH_THRESHOLD:
+        return pdf_to_word_task.s(pdf_path, docx_path, download_name)
+    
+    batches = [
+        pdf_to_word_pages_task.s(
+            pdf_path,
+            f"{docx_path}.part{k}.docx",
+            k * JOB_BATCH_PAGES,
+            min((k + 1) * JOB_BATCH_PAGES, page_count)
+        )
+        for k in range(math.ceil(page_count / JOB_BATCH_PAGES))
+    ]
+    logger.info(f"Splitting {page_count} pages into {len(batches)} batches")
+    return chord(batches, join_docx_parts_task.s(docx_path, download_name))
+
+def queue_job(job, uploaded_files):
+    """Submit a conversion job and respond with its id instead of the converted file"""
+    result = job.apply_async()
+    
+    # The worker still needs the uploads; the stale-file reaper removes them later
+    uploaded_files.clear()
+    
+    logger.debug("Queued conversion job %s", result.id)
+    return jsonify({
+        'job_id': result.id,
+        'status_url': f'/api/status/{result.id}',
+        'download_url': f'/api/download/{result.id}'
+    }), 202
+
+def async_unavailable():
+    """Error response for ?async=1 requests when Celery is not installed"""
+    return jsonify({'error': 'Background conversion is not available. Please install celery[redis] and docxcompose.'}), 503
+
+def send_converted_file(file_path, download_name, mimetype=None):
+    """
+    Send a converted file as an attachment. With X_ACCEL_REDIRECT_PREFIX set, nginx
+    streams the file itself with sendfile() and the app only returns the headers.
+    """
+    if not X_ACCEL_REDIRECT_PREFIX:
+        return send_file(
+            file_path,
+            as_attachment=True,
+            download_name=download_name,
+            mimetype=mimetype
+        )
+    
+    if mimetype is None:
+        mimetype = mimetypes.guess_type(download_name)[0] or 'application/octet-stream'
+    
+    response = app.response_class(mimetype=mimetype)
+    
+    # Same Content-Disposition encoding as werkzeug's send_file
+    try:
+        download_name.encode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=download_name)
+    except UnicodeEncodeError:
+        simple_name = unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode('ascii')
+        quoted_name = quote(download_name, safe="!#$&+-.^_`|~")
+        response.headers.set('Content-Disposition', 'attachment', filename=simple_name, **{'filename*': f"UTF-8''{quoted_name}"})
+    
+    relative_path = os.path.relpath(file_path, CONVERTED_ROOT)
+    response.headers['X-Accel-Redirect'] = X_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(relative_path)
+    return response
+
+@app.before_request
+def check_scratch_space():
+    """Refuse uploads while the upload or converted folder is nearly full"""
+    if request.method != 'POST':
+        return None
+    
+    free_space = min(shutil.disk_usage(folder).free for folder in (UPLOAD_FOLDER, CONVERTED_FOLDER))
+    if free_space < MIN_FREE_SCRATCH_SPACE and IMAGE_PDF_CACHE_SIZE > 0:
+        # Cached image PDFs are the one thing here that can go early
+        evict_cached_image_pdfs()
+        free_space = min(shutil.disk_usage(folder).free for folder in (UPLOAD_FOLDER, CONVERTED_FOLDER))
+    
+    if free_space < MIN_FREE_SCRATCH_SPACE:
+        logger.warning(f"Refusing upload: only {free_space} bytes free for conversions")
+        return jsonify({'error': 'Server is busy. Please try again shortly.'}), 503
+    
+    return None
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -483,6 +1559,7 @@ def health_check():
         'message': 'Multi-Tool Document Converter API is running',
         'pdf2docx_available': PDF2DOCX_AVAILABLE,
         'libreoffice_available': libreoffice_ok,
+        'background_jobs_available': CELERY_AVAILABLE,
         'supported_tools': ['pdf-to-word', 'word-to-pdf', 'merge-pdf', 'image-to-pdf']
     })
 
@@ -499,42 +1576,50 @@ def convert_pdf_to_word():
         if not PDF2DOCX_AVAILABLE:
             return jsonify({'error': 'pdf2docx library is not available. Please install it: pip install pdf2docx'}), 500
         
-        if 'file' not in request.files:
+        if async_requested() and not CELERY_AVAILABLE:
+            return async_unavailable()
+        
+        # Stream the uploaded file straight to disk
+        files, _ = receive_uploads(['file'])
+        uploaded_files.extend(path for path, _, _ in files.values())
+        
+        # Schedule cleanup after response is sent
+        @after_this_request
+        def cleanup_files(response):
+            schedule_cleanup(itertools.chain(uploaded_files, converted_files))
+            return response
+        
+        if 'file' not in files:
             return jsonify({'error': 'No file uploaded'}), 400
         
-        file = request.files['file']
+        pdf_path, original_filename, file_size = files['file']
         
-        if file.filename == '':
+        if original_filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not allowed_file(file.filename, 'pdf'):
+        if not allowed_file(original_filename, 'pdf'):
             return jsonify({'error': 'Only PDF files are allowed'}), 400
         
-        # Save uploaded file with unique name
-        unique_id = str(uuid.uuid4())
-        filename = secure_filename(file.filename)
-        pdf_filename = f"{unique_id}_{filename}"
-        pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
+        logger.debug("Saved uploaded PDF: %s", pdf_path)
         
-        logger.info(f"Saving uploaded PDF: {pdf_path}")
-        file.save(pdf_path)
-        uploaded_files.append(pdf_path)
-        
-        # Verify file was saved correctly
-        if not os.path.exists(pdf_path):
-            raise Exception("Failed to save uploaded file")
-        
-        file_size = os.path.getsize(pdf_path)
+        # receive_uploads() raises if a write fails; only emptiness is left to check
         if file_size == 0:
             raise Exception("Uploaded file is empty")
         
-        logger.info(f"✅ File saved successfully (size: {file_size} bytes)")
+        logger.debug("File saved successfully (size: %d bytes)", file_size)
         
         # Generate output path
-        original_name = Path(filename).stem
+        unique_id = new_id()
+        original_name = os.path.splitext(secure_filename(original_filename))[0]
         docx_filename = f"{unique_id}_{original_name}.docx"
         docx_path = os.path.join(app.config['CONVERTED_FOLDER'], docx_filename)
         
+        # Generate download filename
+        download_filename = f"{original_name}.docx"
+        
+        if async_requested():
+            return queue_job(pdf_to_word_job(pdf_path, docx_path, download_filename), uploaded_files)
+        
         # Convert PDF to DOCX using pdf2docx
         logger.info("Starting PDF to DOCX conversion with pdf2docx...")
         convert_pdf_to_docx_with_pdf2docx(pdf_path, docx_path)
@@ -548,32 +1633,23 @@ def convert_pdf_to_word():
         if docx_size == 0:
             raise Exception("Conversion completed but output file is empty")
         
-        # Generate download filename
-        download_filename = f"{original_name}.docx"
-        
-        logger.info(f"✅ Sending DOCX file: {download_filename} (size: {docx_size} bytes)")
-        
-        # Schedule cleanup after response is sent
-        @after_this_request
-        def cleanup_files(response):
-            cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-            threading.Thread(target=cleanup_func, daemon=True).start()
-            return response
+        logger.debug("Sending DOCX file: %s (size: %d bytes)", download_filename, docx_size)
         
         # Send the file with proper headers
-        return send_file(
+        return send_converted_file(
             docx_path,
-            as_attachment=True,
-            download_name=download_filename,
+            download_filename,
             mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         )
         
+    except RequestEntityTooLarge:
+        raise
+        
     except Exception as e:
         logger.error(f"❌ PDF to Word conversion error: {str(e)}")
         
         # Clean up files immediately on error
-        cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-        cleanup_func()
+        unlink_files(uploaded_files + converted_files)
         
         return jsonify({'error': f'Conversion error: {str(e)}'}), 500
 
@@ -590,68 +1666,62 @@ def convert_word_to_pdf():
         if not check_libreoffice_installation():
             return jsonify({'error': 'LibreOffice is not available. Please install LibreOffice for document conversion.'}), 500
         
-        if 'file' not in request.files:
+        if async_requested() and not CELERY_AVAILABLE:
+            return async_unavailable()
+        
+        # Stream the uploaded file straight to disk
+        files, _ = receive_uploads(['file'])
+        uploaded_files.extend(path for path, _, _ in files.values())
+        
+        # Schedule cleanup after response is sent
+        @after_this_request
+        def cleanup_files(response):
+            schedule_cleanup(itertools.chain(uploaded_files, converted_files))
+            return response
+        
+        if 'file' not in files:
             return jsonify({'error': 'No file uploaded'}), 400
         
-        file = request.files['file']
+        word_path, original_filename, file_size = files['file']
         
-        if file.filename == '':
+        if original_filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not allowed_file(file.filename, 'word'):
+        if not allowed_file(original_filename, 'word'):
             return jsonify({'error': 'Only Word documents (.doc, .docx) are allowed'}), 400
         
-        # Save uploaded file
-        unique_id = str(uuid.uuid4())
-        filename = secure_filename(file.filename)
-        word_filename = f"{unique_id}_{filename}"
-        word_path = os.path.join(app.config['UPLOAD_FOLDER'], word_filename)
-        
-        logger.info(f"Saving uploaded Word file: {word_path}")
-        file.save(word_path)
-        uploaded_files.append(word_path)
-        
-        # Verify file was saved correctly
-        if not os.path.exists(word_path):
-            raise Exception("Failed to save uploaded file")
+        logger.debug("Saved uploaded Word file: %s", word_path)
         
-        file_size = os.path.getsize(word_path)
+        # receive_uploads() raises if a write fails; only emptiness is left to check
         if file_size == 0:
             raise Exception("Uploaded file is empty")
         
-        logger.info(f"✅ File saved successfully (size: {file_size} bytes)")
+        logger.debug("File saved successfully (size: %d bytes)", file_size)
+        
+        # Generate download filename
+        original_name = os.path.splitext(secure_filename(original_filename))[0]
+        download_filename = f"{original_name}.pdf"
+        
+        if async_requested():
+            return queue_job(word_to_pdf_task.s(word_path, app.config['CONVERTED_FOLDER'], download_filename), uploaded_files)
         
         # Convert Word to PDF
         logger.info("Starting Word to PDF conversion...")
         pdf_path = convert_with_libreoffice(word_path, app.config['CONVERTED_FOLDER'], 'pdf')
         converted_files.append(pdf_path)
         
-        # Generate download filename
-        original_name = Path(filename).stem
-        download_filename = f"{original_name}.pdf"
-        
-        logger.info(f"✅ Sending PDF file: {download_filename}")
+        logger.debug("Sending PDF file: %s", download_filename)
         
-        # Schedule cleanup after response is sent
-        @after_this_request
-        def cleanup_files(response):
-            cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-            threading.Thread(target=cleanup_func, daemon=True).start()
-            return response
+        return send_converted_file(pdf_path, download_filename, mimetype='application/pdf')
         
-        return send_file(
-            pdf_path,
-            as_attachment=True,
-            download_name=download_filename,
-            mimetype='application/pdf'
-        )
+    except RequestEntityTooLarge:
+        raise
         
     except Exception as e:
         logger.error(f"❌ Word to PDF conversion error: {str(e)}")
         
         # Clean up files immediately on error
-        cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-        cleanup_func()
+        unlink_files(uploaded_files + converted_files)
         
         return jsonify({'error': f'Conversion error: {str(e)}'}), 500
 
@@ -664,8 +1734,21 @@ def merge_pdf_files():
     try:
         logger.info("=== PDF Merge Request ===")
         
+        if async_requested() and not CELERY_AVAILABLE:
+            return async_unavailable()
+        
+        # Stream the uploaded files straight to disk
+        files, values = receive_uploads([f'file_{i}' for i in range(10)], ['file_count'])
+        uploaded_files.extend(path for path, _, _ in files.values())
+        
+        # Schedule cleanup after response is sent
+        @after_this_request
+        def cleanup_files(response):
+            schedule_cleanup(itertools.chain(uploaded_files, converted_files))
+            return response
+        
         # Get file count
-        file_count = int(request.form.get('file_count', 0))
+        file_count = int(values.get('file_count', 0))
         
         if file_count < 2:
             return jsonify({'error': 'At least 2 PDF files are required for merging'}), 400
@@ -680,63 +1763,47 @@ def merge_pdf_files():
         
         for i in range(file_count):
             file_key = f'file_{i}'
-            if file_key not in request.files:
+            if file_key not in files:
                 return jsonify({'error': f'Missing file {i+1}'}), 400
             
-            file = request.files[file_key]
+            pdf_path, original_filename, file_size = files[file_key]
             
-            if file.filename == '':
+            if original_filename == '':
                 return jsonify({'error': f'File {i+1} is empty'}), 400
             
-            if not allowed_file(file.filename, 'pdf'):
+            if not allowed_file(original_filename, 'pdf'):
                 return jsonify({'error': f'File {i+1} must be a PDF'}), 400
             
-            # Save uploaded file
-            unique_id = str(uuid.uuid4())
-            filename = secure_filename(file.filename)
-            pdf_filename = f"{unique_id}_{filename}"
-            pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-            
-            logger.info(f"Saving file {i+1}: {pdf_path}")
-            file.save(pdf_path)
-            uploaded_files.append(pdf_path)
             pdf_paths.append(pdf_path)
             
-            # Verify file was saved correctly
-            if not os.path.exists(pdf_path) or os.path.getsize(pdf_path) == 0:
+            # receive_uploads() raises if a write fails; only emptiness is left to check
+            if file_size == 0:
                 raise Exception(f"Failed to save file {i+1}")
             
-            logger.info(f"✅ File {i+1} saved (size: {os.path.getsize(pdf_path)} bytes)")
+            logger.debug("File %d saved (size: %d bytes)", i + 1, file_size)
         
         # Merge PDFs
-        merged_filename = f"merged_{str(uuid.uuid4())}.pdf"
+        merged_filename = f"merged_{new_id()}.pdf"
         merged_path = os.path.join(app.config['CONVERTED_FOLDER'], merged_filename)
         
+        if async_requested():
+            return queue_job(merge_pdfs_task.s(pdf_paths, merged_path, 'merged_document.pdf'), uploaded_files)
+        
         merge_pdfs(pdf_paths, merged_path)
         converted_files.append(merged_path)
         
-        logger.info(f"✅ Sending merged PDF file")
+        logger.debug("Sending merged PDF file")
         
-        # Schedule cleanup after response is sent
-        @after_this_request
-        def cleanup_files(response):
-            cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-            threading.Thread(target=cleanup_func, daemon=True).start()
-            return response
+        return send_converted_file(merged_path, 'merged_document.pdf', mimetype='application/pdf')
         
-        return send_file(
-            merged_path,
-            as_attachment=True,
-            download_name='merged_document.pdf',
-            mimetype='application/pdf'
-        )
+    except RequestEntityTooLarge:
+        raise
         
     except Exception as e:
         logger.error(f"❌ PDF merge error: {str(e)}")
         
         # Clean up files immediately on error
-        cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-        cleanup_func()
+        unlink_files(uploaded_files + converted_files)
         
         return jsonify({'error': f'Merge error: {str(e)}'}), 500
 
@@ -749,13 +1816,26 @@ def convert_images_to_pdf():
     try:
         logger.info("=== Image to PDF Conversion Request ===")
         
+        if async_requested() and not CELERY_AVAILABLE:
+            return async_unavailable()
+        
+        # Stream the uploaded files straight to disk
+        files, values = receive_uploads(['file'] + [f'file_{i}' for i in range(20)], ['file_count'])
+        uploaded_files.extend(path for path, _, _ in files.values())
+        
+        # Schedule cleanup after response is sent
+        @after_this_request
+        def cleanup_files(response):
+            schedule_cleanup(itertools.chain(uploaded_files, converted_files))
+            return response
+        
         # Check if single file or multiple files
-        if 'file' in request.files:
+        if 'file' in files:
             # Single file
-            files = [request.files['file']]
+            images = [files['file']]
         else:
             # Multiple files
-            file_count = int(request.form.get('file_count', 0))
+            file_count = int(values.get('file_count', 0))
             
             if file_count == 0:
                 return jsonify({'error': 'No files uploaded'}), 400
@@ -763,83 +1843,118 @@ def convert_images_to_pdf():
             if file_count > 20:
                 return jsonify({'error': 'Maximum 20 images allowed'}), 400
             
-            files = []
+            images = []
             for i in range(file_count):
                 file_key = f'file_{i}'
-                if file_key in request.files:
-                    files.append(request.files[file_key])
+                if file_key in files:
+                    images.append(files[file_key])
         
-        if not files:
+        if not images:
             return jsonify({'error': 'No files uploaded'}), 400
         
-        logger.info(f"Converting {len(files)} images to PDF")
+        logger.info(f"Converting {len(images)} images to PDF")
         
-        # Validate and save files
+        # Validate saved files
         image_paths = []
         
-        for i, file in enumerate(files):
-            if file.filename == '':
+        for i, (image_path, original_filename, file_size) in enumerate(images):
+            if original_filename == '':
                 return jsonify({'error': f'File {i+1} is empty'}), 400
             
-            if not allowed_file(file.filename, 'image'):
+            if not allowed_file(original_filename, 'image'):
                 return jsonify({'error': f'File {i+1} must be an image (JPG, JPEG, PNG)'}), 400
             
-            # Save uploaded file
-            unique_id = str(uuid.uuid4())
-            filename = secure_filename(file.filename)
-            image_filename = f"{unique_id}_{filename}"
-            image_path = os.path.join(app.config['UPLOAD_FOLDER'], image_filename)
-            
-            logger.info(f"Saving image {i+1}: {image_path}")
-            file.save(image_path)
-            uploaded_files.append(image_path)
             image_paths.append(image_path)
             
-            # Verify file was saved correctly
-            if not os.path.exists(image_path) or os.path.getsize(image_path) == 0:
+            # receive_uploads() raises if a write fails; only emptiness is left to check
+            if file_size == 0:
                 raise Exception(f"Failed to save image {i+1}")
             
-            logger.info(f"✅ Image {i+1} saved (size: {os.path.getsize(image_path)} bytes)")
-        
-        # Convert images to PDF
-        pdf_filename = f"images_{str(uuid.uuid4())}.pdf"
-        pdf_path = os.path.join(app.config['CONVERTED_FOLDER'], pdf_filename)
-        
-        images_to_pdf(image_paths, pdf_path)
-        converted_files.append(pdf_path)
+            logger.debug("Image %d saved (size: %d bytes)", i + 1, file_size)
         
         # Generate download filename
-        if len(files) == 1:
-            original_name = Path(files[0].filename).stem
+        if len(images) == 1:
+            original_name = os.path.splitext(os.path.basename(images[0][1]))[0]
             download_filename = f"{original_name}.pdf"
         else:
             download_filename = 'images_combined.pdf'
         
-        logger.info(f"✅ Sending PDF file: {download_filename}")
+        if async_requested():
+            pdf_path = os.path.join(app.config['CONVERTED_FOLDER'], f"images_{new_id()}.pdf")
+            return queue_job(images_to_pdf_task.s(image_paths, pdf_path, download_filename), uploaded_files)
+        
+        # Repeated uploads of the same images (e.g. client retries) reuse the first PDF
+        cache_key = None
+        if IMAGE_PDF_CACHE_SIZE > 0:
+            cache_key = image_set_cache_key(image_paths)
+            cached_pdf = open_cached_image_pdf(cache_key)
+            if cached_pdf is not None:
+                logger.debug("Sending cached PDF file: %s", download_filename)
+                return send_file(cached_pdf, as_attachment=True, download_name=download_filename, mimetype='application/pdf')
+        
+        # Image PDFs are small (inputs are capped and downscaled), so build them in
+        # memory rather than writing, re-reading and deleting a converted file
+        pdf_buffer = io.BytesIO()
+        images_to_pdf(image_paths, pdf_buffer)
+        pdf_buffer.seek(0)
+        
+        if cache_key is not None:
+            try:
+                store_cached_image_pdf(cache_key, pdf_buffer.getbuffer())
+            except OSError as e:
+                logger.warning(f"Could not cache image PDF: {e}")
         
-        # Schedule cleanup after response is sent
-        @after_this_request
-        def cleanup_files(response):
-            cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-            threading.Thread(target=cleanup_func, daemon=True).start()
-            return response
+        logger.debug("Sending PDF file: %s", download_filename)
         
-        return send_file(
-            pdf_path,
-            as_attachment=True,
-            download_name=download_filename,
-            mimetype='application/pdf'
-        )
+        return send_file(pdf_buffer, as_attachment=True, download_name=download_filename, mimetype='application/pdf')
+        
+    except RequestEntityTooLarge:
+        raise
         
     except Exception as e:
         logger.error(f"❌ Image to PDF conversion error: {str(e)}")
         
         # Clean up files immediately on error
-        cleanup_func = cleanup_files_after_response(uploaded_files + converted_files)
-        cleanup_func()
+        unlink_files(uploaded_files + converted_files)
         
         return jsonify({'error': f'Image conversion error: {str(e)}'}), 500
 
+@app.route('/api/status/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report the state of a background conversion job"""
+    if not CELERY_AVAILABLE:
+        return async_unavailable()
+    
+    result = celery_app.AsyncResult(job_id)
+    response = {'job_id': job_id, 'status': result.state.lower()}
+    
+    if result.failed():
+        response['error'] = f'Conversion error: {result.result}'
+    
+    return jsonify(response)
+
+@app.route('/api/download/<job_id>', methods=['GET'])
+def download_job(job_id):
+    """Send the output of a finished background conversion job"""
+    if not CELERY_AVAILABLE:
+        return async_unavailable()
+    
+    result = celery_app.AsyncResult(job_id)
+    
+    if not result.ready():
+        return jsonify({'error': 'Conversion is still in progress'}), 409
+    
+    if result.failed():
+        return jsonify({'error': f'Conversion error: {result.result}'}), 500
+    
+    job = result.result
+    if not os.path.exists(job['path']):
+        return jsonify({'error': 'Converted file has expired'}), 410
+    
+    logger.debug("Sending job %s output: %s", job_id, job['download_name'])
+    
+    return send_converted_file(job['path'], job['download_name'])
+
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error"""
@@ -852,15 +1967,69 @@ def internal_error(e):
     logger.error(f"Internal server error: {e}")
     return jsonify({'error': 'Internal server error'}), 500
 
+def find_free_port():
+    """Ask the kernel for an unused localhost TCP port"""
+    with socket.socket() as sock:
+        sock.bind((SOFFICE_HOST, 0))
+        return sock.getsockname()[1]
+
+def start_private_libreoffice_daemon():
+    """Start a LibreOffice daemon on a free port, owned by this worker process"""
+    global SOFFICE_PORT
+    
+    if UNO_AVAILABLE:
+        SOFFICE_PORT = find_free_port()
+        start_libreoffice_daemon()
+        atexit.register(stop_libreoffice_daemon)
+
+def init_gunicorn_worker():
+    """
+    Per-worker setup, called from gunicorn's post_fork hook. Each worker gets its own
+    folders, stale-file reaper, janitor, pdf2docx pool and LibreOffice daemon so workers
+    never race on each other's files.
+    """
+    global UPLOAD_FOLDER, CONVERTED_FOLDER
+    
+    # The pdf2docx pool's workers are forked from this worker and get their own
+    # log listener from the at-fork hook
+    start_pdf2docx_pool()
+    
+    UPLOAD_FOLDER = make_upload_folder()
+    CONVERTED_FOLDER = make_converted_folder()
+    app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+    app.config['CONVERTED_FOLDER'] = CONVERTED_FOLDER
+    
+    cleanup_thread = threading.Thread(target=cleanup_old_files, daemon=True)
+    cleanup_thread.start()
+    start_janitor()
+    
+    start_private_libreoffice_daemon()
+    
+    # Warm the cached LibreOffice status without delaying the worker
+    threading.Thread(target=check_libreoffice_installation, daemon=True).start()
+    
+    logger.info(f"Worker {os.getpid()} ready (upload folder: {UPLOAD_FOLDER}, converted folder: {CONVERTED_FOLDER})")
+
+# Keep pdf2docx workers and one soffice process warm for the lifetime of the app,
+# and start the janitor. Under gunicorn (CONVERTER_DEFER_SERVICES) each worker starts
+# its own from post_fork instead; Celery workers convert in-process.
+if not os.environ.get('CONVERTER_DEFER_SERVICES'):
+    start_pdf2docx_pool()
+    start_janitor()
+    atexit.register(remove_worker_folders, os.getpid())
+    
+    if UNO_AVAILABLE:
+        start_libreoffice_daemon()
+        atexit.register(stop_libreoffice_daemon)
+    
+    # Warm the cached LibreOffice status without blocking the import
+    threading.Thread(target=check_libreoffice_installation, daemon=True).start()
+
 if __name__ == '__main__':
     # Start cleanup thread
     cleanup_thread = threading.Thread(target=cleanup_old_files, daemon=True)
     cleanup_thread.start()
     
-    # Create directories if they don't exist
-    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-    os.makedirs(CONVERTED_FOLDER, exist_ok=True)
-    
     logger.info("=== Multi-Tool Document Converter API Starting ===")
     logger.info(f"Upload folder: {UPLOAD_FOLDER}")
     logger.info(f"Converted folder: {CONVERTED_FOLDER}")
@@ -883,5 +2052,12 @@ if __name__ == '__main__':
         logger.warning("⚠️  LibreOffice not found - Word to PDF conversion will not work")
         logger.warning("   Please run: sudo apt-get install libreoffice")
     
-    # Run the Flask app
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Run the Flask app; FLASK_DEBUG=1 turns the debugger on. The reloader stays off:
+    # it stats every module on a timer and would start a second soffice and pdf2docx pool
+    app.run(
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        debug=os.environ.get('FLASK_DEBUG') == '1',
+        use_reloader=False,
+        threaded=True
+    )
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Gunicorn configuration for the Multi-Tool Document Converter Backend
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+
+Conversions are CPU heavy (pdf2docx, LibreOffice), so they run in separate
+worker processes, while each worker's threads handle upload/download I/O.
+"""
+
+import os
+
+# The app is preloaded in the master; per-worker services start in post_fork
+os.environ['CONVERTER_DEFER_SERVICES'] = '1'
+# Workers already convert in parallel; don't let each one fork a process per core too
+os.environ.setdefault('CONVERT_CPU_COUNT', '1')
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = os.cpu_count() or 1
+worker_class = 'gthread'
+threads = 4
+timeout = 600  # LibreOffice conversions may take up to 300 seconds
+preload_app = True  # import pdf2docx and friends once, share them copy-on-write
+
+# send_file() hands converted files over as wsgi.file_wrapper objects; let
+# gunicorn answer them with sendfile(2) instead of copying through Python
+sendfile = True
+
+# Keep the worker heartbeat file in RAM so it never stalls on disk I/O
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+def post_fork(server, worker):
+    """Give every worker its own folders, cleanup thread, pdf2docx pool and LibreOffice daemon"""
+    import app as converter
+    converter.init_gunicorn_worker()
+
+def worker_exit(server, worker):
+    """Stop the worker's pdf2docx pool and LibreOffice daemon"""
+    import app as converter
+    converter.stop_pdf2docx_pool()
+    converter.stop_libreoffice_daemon()
+
+def child_exit(server, worker):
+    """Delete the worker's folders; runs in the master after every worker exit, crashes included"""
+    import app as converter
+    converter.remove_worker_folders(worker.pid)
@@ -9,7 +9,7 @@ sudo apt-get update
 
 # Install LibreOffice for Word to PDF conversion
 echo "📄 Installing LibreOffice for Word to PDF conversion..."
-sudo apt-get install -y libreoffice
+sudo apt-get install -y libreoffice python3-uno
 
 # Install Python3 and pip if not already installed
 echo "🐍 Installing Python3 and pip..."
@@ -19,6 +19,8 @@ sudo apt-get install -y python3 python3-pip python3-venv
 echo "🔧 Installing system dependencies..."
 sudo apt-get install -y \
     python3-dev \
+    libjpeg-dev \
+    zlib1g-dev \
     libmagic1 \
     libmagic-dev \
     poppler-utils \
@@ -26,8 +28,9 @@ sudo apt-get install -y \
     imagemagick
 
 # Create virtual environment (optional but recommended)
+# System site packages are needed so the venv can import python3-uno
 echo "🌐 Creating Python virtual environment..."
-python3 -m venv venv
+python3 -m venv --system-site-packages venv
 source venv/bin/activate
 
 # Install Python dependencies
@@ -35,6 +38,15 @@ echo "📚 Installing Python dependencies..."
 pip3 install --upgrade pip
 pip3 install -r requirements.txt
 
+# Pillow-SIMD is a drop-in Pillow fork with faster resize and convert kernels.
+# Both install the same PIL package, so Pillow has to go first, and only this one
+# source build gets -mavx2; it would crash with SIGILL on CPUs without AVX2
+if grep -qw avx2 /proc/cpuinfo 2>/dev/null; then
+    echo "⚡ Replacing Pillow with Pillow-SIMD (AVX2)..."
+    pip3 uninstall -y pillow
+    CC="cc -mavx2" pip3 install --no-deps --no-cache-dir Pillow-SIMD==9.5.0.post1
+fi
+
 # Verify installations
 echo ""
 echo "=== Verification ==="
@@ -62,10 +74,16 @@ except ImportError:
     print('❌ pdf2docx not installed')
 
 try:
-    import PyPDF2
-    print('✅ PyPDF2 installed:', PyPDF2.__version__)
+    import pikepdf
+    print('✅ pikepdf installed:', pikepdf.__version__)
+except ImportError:
+    print('❌ pikepdf not installed')
+
+try:
+    import uno
+    print('✅ python-uno installed')
 except ImportError:
-    print('❌ PyPDF2 not installed')
+    print('❌ python-uno not installed')
 
 try:
     from PIL import Image
@@ -86,11 +104,14 @@ echo "🚀 To start the backend server, run:"
 echo "   cd backend"
 echo "   python3 app.py"
 echo ""
+echo "🏭 For production, run it under gunicorn instead:"
+echo "   gunicorn -c gunicorn.conf.py app:app"
+echo ""
 echo "📝 The server will run on http://localhost:5000"
 echo "🔍 Check converter.log for detailed conversion logs"
 echo ""
 echo "🎯 Key improvements:"
 echo "   • PDF to Word: Now uses pdf2docx library (much more reliable than LibreOffice)"
-echo "   • Word to PDF: Uses LibreOffice (works well for this direction)"
-echo "   • PDF Merge: Uses PyPDF2"
+echo "   • Word to PDF: Uses a persistent LibreOffice daemon over UNO (no per-request startup)"
+echo "   • PDF Merge: Uses pikepdf (qpdf)"
 echo "   • Image to PDF: Uses Pillow + ReportLab"
\ No newline at end of file